@@ -34,3 +34,4 @@ class AppConfig:
     target_fps: int = 30
     show_visualizer: bool = True
     show_camera: bool = True
+    gpu_resize: bool = False
@@ -0,0 +1,128 @@
+import cv2
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE: bool = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+GLYPH_CHARSET: str = "0123456789.,:[]()RGBrnCD-+ "
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _blit_texts(canvas: np.ndarray, masks: np.ndarray, advances: np.ndarray,
+                    cell_starts: np.ndarray, origins: np.ndarray, colors: np.ndarray,
+                    text_starts: np.ndarray, char_indices: np.ndarray) -> None:
+        height: int = canvas.shape[0]
+        width: int = canvas.shape[1]
+        glyph_height: int = masks.shape[1]
+        glyph_width: int = masks.shape[2]
+
+        for cell in prange(cell_starts.shape[0] - 1):
+            for text in range(cell_starts[cell], cell_starts[cell + 1]):
+                pen_x: float = origins[text, 0]
+                y: int = origins[text, 1]
+                for k in range(text_starts[text], text_starts[text + 1]):
+                    glyph: int = char_indices[k]
+                    x: int = int(pen_x + 0.5)
+                    for gy in range(glyph_height):
+                        cy: int = y + gy
+                        if cy < 0 or cy >= height:
+                            continue
+                        for gx in range(glyph_width):
+                            cx: int = x + gx
+                            if cx < 0 or cx >= width:
+                                continue
+                            alpha: int = masks[glyph, gy, gx]
+                            if alpha == 0:
+                                continue
+                            for channel in range(3):
+                                canvas[cy, cx, channel] = (colors[text, channel] * alpha
+                                                           + canvas[cy, cx, channel] * (255 - alpha) + 127) // 255
+                    pen_x += advances[glyph]
+
+
+class GlyphAtlas:
+    def __init__(self, font: int, font_scale: float, thickness: int, charset: str = GLYPH_CHARSET,
+                 index_cache_limit: int = 4096) -> None:
+        self.charset: str = charset
+        self._char_index: Dict[str, int] = {ch: i for i, ch in enumerate(charset)}
+
+        sizes: List[Tuple[int, int]] = [cv2.getTextSize(ch, font, font_scale, thickness)[0] for ch in charset]  # type: ignore[misc]
+        baselines: List[int] = [cv2.getTextSize(ch, font, font_scale, thickness)[1] for ch in charset]
+
+        self.margin: int = thickness + 1
+        self.ascent: int = max(size[1] for size in sizes) + self.margin
+        glyph_height: int = self.ascent + max(baselines) + self.margin
+        glyph_width: int = max(size[0] for size in sizes) + (2 * self.margin)
+
+        self.masks: np.ndarray = np.zeros((len(charset), glyph_height, glyph_width), dtype=np.uint8)
+        self.advances: np.ndarray = np.array(
+            [(cv2.getTextSize(ch * 11, font, font_scale, thickness)[0][0] - size[0]) / 10
+             for ch, size in zip(charset, sizes)],
+            dtype=np.float64
+        )
+
+        i: int
+        ch: str
+        for i, ch in enumerate(charset):
+            cv2.putText(self.masks[i], ch, (self.margin, self.ascent),
+                        font, font_scale, (255,), thickness, cv2.LINE_AA)
+
+        self._index_cache: OrderedDict[str, Optional[Tuple[int, ...]]] = OrderedDict()
+        self._index_cache_limit: int = index_cache_limit
+
+    def _glyph_indices(self, text: str) -> Optional[Tuple[int, ...]]:
+        if text in self._index_cache:
+            self._index_cache.move_to_end(text)
+            return self._index_cache[text]
+
+        indices: Optional[Tuple[int, ...]] = None
+        if all(ch in self._char_index for ch in text):
+            indices = tuple(self._char_index[ch] for ch in text)
+        self._index_cache[text] = indices
+        if len(self._index_cache) > self._index_cache_limit:
+            self._index_cache.popitem(last=False)
+        return indices
+
+    def supports(self, text: str) -> bool:
+        return self._glyph_indices(text) is not None
+
+    def warm_up(self) -> None:
+        scratch: np.ndarray = np.zeros((self.masks.shape[1], self.masks.shape[2], 3), dtype=np.uint8)
+        self.draw(scratch, [[(self.charset[0], (self.margin, self.ascent), [255, 255, 255])]])
+
+    def draw(self, canvas: np.ndarray,
+             cell_texts: List[List[Tuple[str, Tuple[int, int], List[int]]]]) -> None:
+        cell_starts: List[int] = [0]
+        origins: List[Tuple[int, int]] = []
+        colors: List[List[int]] = []
+        text_starts: List[int] = [0]
+        char_indices: List[int] = []
+
+        texts: List[Tuple[str, Tuple[int, int], List[int]]]
+        for texts in cell_texts:
+            text: str
+            origin: Tuple[int, int]
+            color: List[int]
+            for text, origin, color in texts:
+                origins.append((origin[0] - self.margin, origin[1] - self.ascent))
+                colors.append(color)
+                char_indices.extend(self._glyph_indices(text))  # type: ignore[arg-type]
+                text_starts.append(len(char_indices))
+            cell_starts.append(len(origins))
+
+        if not origins:
+            return
+
+        _blit_texts(canvas, self.masks, self.advances,
+                    np.array(cell_starts, dtype=np.int32),
+                    np.array(origins, dtype=np.int32),
+                    np.array(colors, dtype=np.int32),
+                    np.array(text_starts, dtype=np.int32),
+                    np.array(char_indices, dtype=np.int32))
@@ -16,10 +16,11 @@ def main() -> None:
         target_fps=30
     )
 
-    visualizer: Optional[DataVisualizer] = DataVisualizer(config.grid, config.show_camera) if config.show_visualizer else None
+    visualizer: Optional[DataVisualizer] = DataVisualizer(config.grid, config.show_camera, config.gpu_resize) if config.show_visualizer else None
 
     if visualizer:
         visualizer.show_loading_screen("Initializing components...")
+        visualizer.warm_up()
 
     analyzer: GridAnalyzer = GridAnalyzer(config.grid)
 
@@ -1,11 +1,13 @@
 import cv2
 import numpy as np
-from typing import Any, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from webcam_osc.config import CellData, GridConfig
+from webcam_osc.glyph_atlas import NUMBA_AVAILABLE, GlyphAtlas
 
 
 class DataVisualizer:
-    def __init__(self, grid_config: GridConfig, show_camera: bool = True) -> None:
+    def __init__(self, grid_config: GridConfig, show_camera: bool = True, gpu_resize: bool = False) -> None:
         self.grid_config: GridConfig = grid_config
         self.window_name: str = "Webcam OSC Visualizer"
         self.should_close: bool = False
@@ -13,6 +15,18 @@ class DataVisualizer:
         self.show_camera_runtime: bool = show_camera
         self.show_grid_runtime: bool = True
 
+        self._camera_interp_shape: Optional[Tuple[int, ...]] = None
+        self._camera_interp: int = cv2.INTER_LINEAR
+
+        self.mouse_x: int = -1
+        self.mouse_y: int = -1
+        self._hovered: Optional[str] = None
+
+        self._gpu_backend: Optional[str] = self._detect_gpu_backend() if gpu_resize else None
+        if self._gpu_backend == "cuda":
+            self._gpu_in: Any = cv2.cuda_GpuMat()  # type: ignore[attr-defined]
+            self._gpu_out: Any = cv2.cuda_GpuMat()  # type: ignore[attr-defined]
+
         self.max_height: int = 900
         self.max_width: int = 1600
 
@@ -22,6 +36,25 @@ class DataVisualizer:
         self.button_width: int = 140
         self.button_spacing: int = 10
 
+        self.cell_font: int = cv2.FONT_HERSHEY_SIMPLEX
+        self.cell_font_scale: float = 0.35
+        self.cell_font_thickness: int = 1
+        self.cell_line_height: int = 14
+        self.cell_text_top: int = 10
+        self._glyph_atlas: Optional[GlyphAtlas] = (
+            GlyphAtlas(self.cell_font, self.cell_font_scale, self.cell_font_thickness) if NUMBA_AVAILABLE else None
+        )
+
+        self.button_font: int = cv2.FONT_HERSHEY_SIMPLEX
+        self.button_font_scale: float = 0.5
+        self.button_font_thickness: int = 1
+
+        self._text_size_cache: OrderedDict[Tuple[str, int, float, int], Tuple[int, int]] = OrderedDict()
+        self._text_size_cache_limit: int = 4096
+        self._loading_cache: Dict[str, np.ndarray] = {}
+        self._button_strip_cache: Dict[Tuple[Optional[str], bool, bool], np.ndarray] = {}
+        self._button_strip_cache_limit: int = 8
+
         self._calculate_responsive_sizes()
 
         self._recalculate_layout()
@@ -29,6 +62,17 @@ class DataVisualizer:
         cv2.namedWindow(self.window_name)
         cv2.setMouseCallback(self.window_name, self._mouse_callback)
 
+    def _detect_gpu_backend(self) -> Optional[str]:
+        try:
+            if hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                return "cuda"
+            if cv2.ocl.haveOpenCL():
+                cv2.ocl.setUseOpenCL(True)
+                return "opencl"
+        except cv2.error:
+            pass
+        return None
+
     def _calculate_responsive_sizes(self) -> None:
         desired_cell_size: int = 150
         desired_camera_width: int = 640
@@ -50,6 +94,22 @@ class DataVisualizer:
         self.grid_width: int = (self.cell_size * self.grid_config.cols) + (self.padding * (self.grid_config.cols + 1))
         self.grid_height: int = (self.cell_size * self.grid_config.rows) + (self.padding * (self.grid_config.rows + 1))
 
+        prefix: str
+        for prefix in ("R:", "G:", "B:", "Br:", "Cn:"):
+            self._measure(prefix, self.cell_font, self.cell_font_scale, self.cell_font_thickness)
+
+    def _measure(self, text: str, font: int, font_scale: float, thickness: int) -> Tuple[int, int]:
+        key: Tuple[str, int, float, int] = (text, font, font_scale, thickness)
+        size: Optional[Tuple[int, int]] = self._text_size_cache.get(key)
+        if size is None:
+            size = cv2.getTextSize(text, font, font_scale, thickness)[0]  # type: ignore[assignment]
+            self._text_size_cache[key] = size  # type: ignore[assignment]
+            if len(self._text_size_cache) > self._text_size_cache_limit:
+                self._text_size_cache.popitem(last=False)
+        else:
+            self._text_size_cache.move_to_end(key)
+        return size  # type: ignore[return-value]
+
     def _recalculate_layout(self) -> None:
         show_cam: bool = self.show_camera_runtime
         show_grid: bool = self.show_grid_runtime
@@ -76,6 +136,11 @@ class DataVisualizer:
         content_width: int = max(widths) if widths else 400
         self.width: int = content_width + (2 * self.padding)
 
+        self._canvas: np.ndarray = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._last_render_key: Optional[Tuple[Any, ...]] = None
+        self._last_camera_frame: Optional[np.ndarray] = None
+        self._canvas_dirty: bool = True
+
         total_button_width: int = (self.button_width * 3) + (self.button_spacing * 2)
         button_start_x: int = (self.width - total_button_width) // 2
 
@@ -100,46 +165,139 @@ class DataVisualizer:
             self.button_bar_y + self.button_height
         )
 
-    def render(self, cells_data: List[CellData], camera_frame: Optional[np.ndarray] = None) -> np.ndarray:
-        canvas: np.ndarray = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        canvas.fill(30)
+        self._update_hovered()
+
+        self._button_text_pos: Dict[Tuple[str, Tuple[int, int, int, int]], Tuple[int, int]] = {}
+        bounds: Tuple[int, int, int, int]
+        labels: Tuple[str, ...]
+        for bounds, labels in (
+            (self.close_button_bounds, ("Close",)),
+            (self.toggle_camera_button_bounds, ("Hide Camera", "Show Camera")),
+            (self.toggle_grid_button_bounds, ("Hide Grid", "Show Grid"))
+        ):
+            x1: int
+            y1: int
+            x2: int
+            y2: int
+            x1, y1, x2, y2 = bounds
+            label: str
+            for label in labels:
+                text_size: Tuple[int, int] = self._measure(label, self.button_font, self.button_font_scale,
+                                                           self.button_font_thickness)
+                self._button_text_pos[(label, bounds)] = (
+                    x1 + ((x2 - x1) - text_size[0]) // 2,
+                    y1 + ((y2 - y1) + text_size[1]) // 2
+                )
 
-        if self.show_camera_runtime and camera_frame is not None:
-            resized_frame: np.ndarray = cv2.resize(camera_frame, (self.camera_width, self.camera_height))
-            camera_x: int = (self.width - self.camera_width) // 2
-            canvas[self.camera_y_offset:self.camera_y_offset + self.camera_height,
-                   camera_x:camera_x + self.camera_width] = resized_frame
+        if show_grid:
+            self._calculate_cell_geometry()
+
+    def _calculate_cell_geometry(self) -> None:
+        grid_x_offset: int = (self.width - self.grid_width) // 2
+        step: int = self.cell_size + self.padding
+
+        cols: np.ndarray = np.arange(self.grid_config.cols, dtype=np.int32)
+        rows: np.ndarray = np.arange(self.grid_config.rows, dtype=np.int32)
+        col_x0: np.ndarray = grid_x_offset + self.padding + cols * step
+        row_y0: np.ndarray = self.grid_y_offset + self.padding + rows * step
+
+        x0_grid: np.ndarray
+        y0_grid: np.ndarray
+        x0_grid, y0_grid = np.meshgrid(col_x0, row_y0)
+
+        self._cell_x0: np.ndarray = x0_grid.ravel().astype(np.int32)
+        self._cell_y0: np.ndarray = y0_grid.ravel().astype(np.int32)
+        self._cell_x1: np.ndarray = self._cell_x0 + self.cell_size
+        self._cell_y1: np.ndarray = self._cell_y0 + self.cell_size
+
+        self._cell_corners: List[Tuple[Tuple[int, int], Tuple[int, int]]] = [
+            ((x0, y0), (x1, y1))
+            for x0, y0, x1, y1 in zip(self._cell_x0.tolist(), self._cell_y0.tolist(),
+                                      self._cell_x1.tolist(), self._cell_y1.tolist())
+        ]
+        self._cell_outlines: List[np.ndarray] = list(np.stack([
+            np.stack([self._cell_x0, self._cell_y0], axis=1),
+            np.stack([self._cell_x1, self._cell_y0], axis=1),
+            np.stack([self._cell_x1, self._cell_y1], axis=1),
+            np.stack([self._cell_x0, self._cell_y1], axis=1)
+        ], axis=1))
+
+        self._cell_colors: np.ndarray = np.empty((self.grid_config.rows * self.grid_config.cols, 3), dtype=np.uint8)
+        self._cell_text_colors: np.ndarray = np.empty((self.grid_config.rows * self.grid_config.cols, 3), dtype=np.uint8)
+        self._dark_text_color: np.ndarray = np.array([50, 50, 50], dtype=np.uint8)
+        self._light_text_color: np.ndarray = np.array([220, 220, 220], dtype=np.uint8)
+        self._prev_cell_state: np.ndarray = np.full((self.grid_config.rows * self.grid_config.cols, 9), -1, dtype=np.int16)
+
+        self._max_text_lines: int = max(0, (self.cell_size - self.text_padding - self.cell_text_top) // self.cell_line_height)
+        self._max_text_width: int = self.cell_size - (2 * self.text_padding)
+        self._ellipsis_w: int = self._measure("...", self.cell_font, self.cell_font_scale,
+                                              self.cell_font_thickness)[0]
 
-        if self.show_grid_runtime:
-            grid_x_offset: int = (self.width - self.grid_width) // 2
+    def render(self, cells_data: List[CellData], camera_frame: Optional[np.ndarray] = None) -> np.ndarray:
+        shown_frame: Optional[np.ndarray] = camera_frame if self.show_camera_runtime else None
+        render_key: Tuple[Any, ...] = (
+            self.show_camera_runtime,
+            self.show_grid_runtime,
+            self._hovered,
+            tuple((c.row, c.col, c.avg_red, c.avg_green, c.avg_blue, c.brightness, c.contrast, c.dominant_color)
+                  for c in cells_data)
+        )
+        if render_key == self._last_render_key and shown_frame is self._last_camera_frame:
+            return self._canvas
+        self._last_render_key = render_key
+        self._last_camera_frame = shown_frame
+
+        canvas: np.ndarray = self._canvas
+        if self._canvas_dirty:
+            canvas.fill(30)
+            self._canvas_dirty = False
 
-            for cell_data in cells_data:
-                x_offset: int = grid_x_offset + self.padding + (cell_data.col * (self.cell_size + self.padding))
-                y_offset: int = self.grid_y_offset + self.padding + (cell_data.row * (self.cell_size + self.padding))
+        if self.show_camera_runtime:
+            camera_x: int = (self.width - self.camera_width) // 2
+            camera_view: np.ndarray = canvas[self.camera_y_offset:self.camera_y_offset + self.camera_height,
+                                             camera_x:camera_x + self.camera_width]
+            if camera_frame is None:
+                camera_view.fill(30)
+            else:
+                self._resize_camera_frame(camera_frame, camera_view)
+
+        if self.show_grid_runtime and cells_data:
+            indices: List[int]
+            changed: List[int]
+            indices, changed = self._prepare_cell_arrays(cells_data)
+            cell_colors: List[List[int]] = self._cell_colors.tolist()
+            text_colors: List[List[int]] = self._cell_text_colors.tolist()
+            changed_indices: List[int] = [indices[position] for position in changed]
+
+            self._fill_cells(changed_indices, cell_colors, canvas)
+            cv2.polylines(canvas, [self._cell_outlines[index] for index in changed_indices],
+                          True, (100, 100, 100), 1)
+
+            glyph_texts: List[List[Tuple[str, Tuple[int, int], List[int]]]] = []
+
+            position: int
+            for position in changed:
+                cell_data: CellData = cells_data[position]
+                index: int = indices[position]
+                x_offset: int
+                y_offset: int
+                x_offset, y_offset = self._cell_corners[index][0]
+
+                if self._max_text_lines <= 0:
+                    continue
+
+                text_y: int = y_offset + self.cell_text_top
+                font: int = self.cell_font
+                font_scale: float = self.cell_font_scale
+                thickness: int = self.cell_font_thickness
+                line_height: int = self.cell_line_height
 
                 r: int
                 g: int
                 b: int
-                r, g, b = int(cell_data.dominant_color[0] * 255), int(cell_data.dominant_color[1] * 255), int(cell_data.dominant_color[2] * 255)
-                cv2.rectangle(canvas,
-                             (x_offset, y_offset),
-                             (x_offset + self.cell_size, y_offset + self.cell_size),
-                             (b, g, r),
-                             -1)
-
-                cv2.rectangle(canvas,
-                             (x_offset, y_offset),
-                             (x_offset + self.cell_size, y_offset + self.cell_size),
-                             (100, 100, 100),
-                             1)
-
-                text_y: int = y_offset + 10
-                font: int = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale: float = 0.35
-                thickness: int = 1
-                line_height: int = 14
-
-                text_color: Tuple[int, int, int] = (50, 50, 50) if cell_data.brightness > 0.5 else (220, 220, 220)
+                b, g, r = cell_colors[index]
+
+                text_color: List[int] = text_colors[index]
 
                 texts: List[str] = [
                     f"[{cell_data.row},{cell_data.col}]",
@@ -151,44 +309,158 @@ class DataVisualizer:
                     f"D:({r},{g},{b})"
                 ]
 
-                max_text_width: int = self.cell_size - (2 * self.text_padding)
-
-                for text in texts:
-                    if text_y + line_height > y_offset + self.cell_size - self.text_padding:
-                        break
+                max_text_width: int = self._max_text_width
+                cell_glyph_texts: List[Tuple[str, Tuple[int, int], List[int]]] = []
 
-                    text_size: tuple[int, int] = cv2.getTextSize(text, font, font_scale, thickness)[0]  # type: ignore[assignment]
+                for text in texts[:self._max_text_lines]:
+                    text_size: Tuple[int, int] = self._measure(text, font, font_scale, thickness)
                     if text_size[0] > max_text_width:
-                        while len(text) > 3 and cv2.getTextSize(text + "...", font, font_scale, thickness)[0][0] > max_text_width:
-                            text = text[:-1]
-                        text = text + "..."
-
-                    cv2.putText(canvas, text,
-                               (x_offset + self.text_padding, text_y),
-                               font, font_scale, text_color, thickness, cv2.LINE_AA)
+                        text = self._truncate_text(text, text_size[0], max_text_width)
+
+                    if self._glyph_atlas is not None and self._glyph_atlas.supports(text):
+                        cell_glyph_texts.append((text, (x_offset + self.text_padding, text_y), text_color))
+                    else:
+                        cv2.putText(canvas, text,
+                                   (x_offset + self.text_padding, text_y),
+                                   font, font_scale, text_color, thickness, cv2.LINE_AA)
                     text_y += line_height
 
-        self._draw_buttons(canvas)
+                glyph_texts.append(cell_glyph_texts)
+
+            if self._glyph_atlas is not None:
+                self._glyph_atlas.draw(canvas, glyph_texts)
+
+        self._blit_buttons(canvas)
 
         return canvas
 
+    def _resize_camera_frame(self, camera_frame: np.ndarray, dst: np.ndarray) -> None:
+        size: Tuple[int, int] = (self.camera_width, self.camera_height)
+        if camera_frame.shape != self._camera_interp_shape:
+            self._camera_interp = self._choose_interpolation(camera_frame.shape[1], camera_frame.shape[0])
+            self._camera_interp_shape = camera_frame.shape
+
+        try:
+            if self._gpu_backend == "cuda":
+                self._gpu_in.upload(camera_frame)
+                cv2.cuda.resize(self._gpu_in, size, self._gpu_out,  # type: ignore[attr-defined]
+                                interpolation=self._camera_interp)
+                dst[...] = self._gpu_out.download()
+                return
+            if self._gpu_backend == "opencl":
+                frame_u: Any = cv2.UMat(camera_frame)  # type: ignore[call-overload]
+                resized_u: Any = cv2.resize(frame_u, size, interpolation=self._camera_interp)
+                dst[...] = resized_u.get()
+                return
+        except cv2.error:
+            self._gpu_backend = None
+
+        resized: np.ndarray = cv2.resize(camera_frame, size, dst=dst, interpolation=self._camera_interp)
+        if resized is not dst:
+            dst[...] = resized
+
+    def _choose_interpolation(self, frame_width: int, frame_height: int) -> int:
+        if self.camera_width < 100 or self.camera_height < 100:
+            return cv2.INTER_NEAREST
+        if (self.camera_width < frame_width and frame_width % self.camera_width == 0
+                and frame_height % self.camera_height == 0):
+            return cv2.INTER_AREA
+        return cv2.INTER_LINEAR
+
+    def _truncate_text(self, text: str, text_width: int, max_width: int) -> str:
+        if len(text) <= 3:
+            return text + "..."
+
+        avg_char_w: float = text_width / len(text)
+        keep: int = min(len(text) - 1, max(3, int((max_width - self._ellipsis_w) // avg_char_w)))
+
+        if self._fits(text[:keep] + "...", max_width):
+            if keep + 1 < len(text) and self._fits(text[:keep + 1] + "...", max_width):
+                keep += 1
+        else:
+            for _ in range(2):
+                if keep <= 3:
+                    break
+                keep -= 1
+                if self._fits(text[:keep] + "...", max_width):
+                    break
+
+        return text[:keep] + "..."
+
+    def _fits(self, text: str, max_width: int) -> bool:
+        return self._measure(text, self.cell_font, self.cell_font_scale, self.cell_font_thickness)[0] <= max_width
+
+    def _prepare_cell_arrays(self, cells_data: List[CellData]) -> Tuple[List[int], List[int]]:
+        indices: np.ndarray = np.fromiter(
+            (cell_data.row * self.grid_config.cols + cell_data.col for cell_data in cells_data),
+            dtype=np.intp, count=len(cells_data)
+        )
+        dominant: np.ndarray = np.array([cell_data.dominant_color for cell_data in cells_data], dtype=np.float64)
+        stats: np.ndarray = np.array(
+            [(cell_data.avg_red, cell_data.avg_green, cell_data.avg_blue, cell_data.brightness, cell_data.contrast)
+             for cell_data in cells_data],
+            dtype=np.float64
+        )
+        brightness: np.ndarray = stats[:, 3]
+
+        self._cell_colors[indices] = (dominant[:, ::-1] * 255).astype(np.uint8)
+        self._cell_text_colors[indices] = np.where(brightness[:, None] > 0.5,
+                                                   self._dark_text_color, self._light_text_color)
+
+        state: np.ndarray = np.empty((len(cells_data), 9), dtype=np.int16)
+        state[:, 0:3] = self._cell_colors[indices]
+        state[:, 3:6] = np.rint(stats[:, 0:3] * 255)
+        state[:, 6:8] = [
+            (int(f"{cell_data.brightness:.2f}".replace(".", "")), int(f"{cell_data.contrast:.2f}".replace(".", "")))
+            for cell_data in cells_data
+        ]
+        state[:, 8] = brightness > 0.5
+
+        changed: np.ndarray = np.any(state != self._prev_cell_state[indices], axis=1)
+        self._prev_cell_state[indices] = state
+
+        return indices.tolist(), np.nonzero(changed)[0].tolist()
+
+    def _fill_cells(self, indices: List[int], cell_colors: List[List[int]], canvas: np.ndarray) -> None:
+        index: int
+        for index in indices:
+            top_left: Tuple[int, int]
+            bottom_right: Tuple[int, int]
+            top_left, bottom_right = self._cell_corners[index]
+            cv2.rectangle(canvas, top_left, bottom_right, cell_colors[index], -1)
+
+    def _blit_buttons(self, canvas: np.ndarray) -> None:
+        strip_top: int = self.button_bar_y
+        strip_bottom: int = self.button_bar_y + self.button_height + 1
+        key: Tuple[Optional[str], bool, bool] = (self._hovered, self.show_camera_runtime, self.show_grid_runtime)
+
+        strip: Optional[np.ndarray] = self._button_strip_cache.get(key)
+        if strip is not None:
+            canvas[strip_top:strip_bottom] = strip
+            return
+
+        self._draw_buttons(canvas)
+        self._button_strip_cache[key] = canvas[strip_top:strip_bottom].copy()
+        if len(self._button_strip_cache) > self._button_strip_cache_limit:
+            del self._button_strip_cache[next(iter(self._button_strip_cache))]
+
     def _draw_buttons(self, canvas: np.ndarray) -> None:
-        font: int = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale: float = 0.5
-        thickness: int = 1
+        font: int = self.button_font
+        font_scale: float = self.button_font_scale
+        thickness: int = self.button_font_thickness
 
-        self._draw_button(canvas, self.close_button_bounds, "Close",
+        self._draw_button(canvas, "close", self.close_button_bounds, "Close",
                          (60, 60, 200), (80, 80, 220), font, font_scale, thickness)
 
         camera_text: str = "Hide Camera" if self.show_camera_runtime else "Show Camera"
-        self._draw_button(canvas, self.toggle_camera_button_bounds, camera_text,
+        self._draw_button(canvas, "camera", self.toggle_camera_button_bounds, camera_text,
                          (60, 120, 60), (80, 150, 80), font, font_scale, thickness)
 
         grid_text: str = "Hide Grid" if self.show_grid_runtime else "Show Grid"
-        self._draw_button(canvas, self.toggle_grid_button_bounds, grid_text,
+        self._draw_button(canvas, "grid", self.toggle_grid_button_bounds, grid_text,
                          (120, 60, 60), (150, 80, 80), font, font_scale, thickness)
 
-    def _draw_button(self, canvas: np.ndarray, bounds: Tuple[int, int, int, int],
+    def _draw_button(self, canvas: np.ndarray, key: str, bounds: Tuple[int, int, int, int],
                      text: str, normal_color: Tuple[int, int, int],
                      hover_color: Tuple[int, int, int], font: int, font_scale: float, thickness: int) -> None:
         x1: int
@@ -197,21 +469,32 @@ class DataVisualizer:
         y2: int
         x1, y1, x2, y2 = bounds
 
-        is_hovered: bool = self._is_mouse_over_bounds(bounds)
-        button_color: Tuple[int, int, int] = hover_color if is_hovered else normal_color
+        button_color: Tuple[int, int, int] = hover_color if self._hovered == key else normal_color
 
         cv2.rectangle(canvas, (x1, y1), (x2, y2), button_color, -1)
 
         cv2.rectangle(canvas, (x1, y1), (x2, y2), (120, 120, 120), 1)
 
-        text_size: tuple[int, int] = cv2.getTextSize(text, font, font_scale, thickness)[0]  # type: ignore[assignment]
-        text_x: int = x1 + ((x2 - x1) - text_size[0]) // 2
-        text_y: int = y1 + ((y2 - y1) + text_size[1]) // 2
-
-        cv2.putText(canvas, text, (text_x, text_y),
+        cv2.putText(canvas, text, self._button_text_pos[(text, bounds)],
                    font, font_scale, (255, 255, 255), thickness, cv2.LINE_AA)
 
+    def warm_up(self) -> None:
+        if self._glyph_atlas is not None:
+            self._glyph_atlas.warm_up()
+
     def show_loading_screen(self, message: str = "Initializing...") -> None:
+        canvas: Optional[np.ndarray] = self._loading_cache.get(message)
+        if canvas is None:
+            canvas = self._build_loading_screen(message)
+            self._loading_cache[message] = canvas
+
+        try:
+            cv2.imshow(self.window_name, canvas)
+            cv2.waitKey(1)
+        except cv2.error:
+            pass
+
+    def _build_loading_screen(self, message: str) -> np.ndarray:
         loading_height: int = 300
         loading_width: int = 500
         canvas: np.ndarray = np.zeros((loading_height, loading_width, 3), dtype=np.uint8)
@@ -234,11 +517,7 @@ class DataVisualizer:
             dot_x: int = (loading_width // 2) - 30 + (i * 30)
             cv2.circle(canvas, (dot_x, dots_y), 5, (100, 100, 200), -1)
 
-        try:
-            cv2.imshow(self.window_name, canvas)
-            cv2.waitKey(1)
-        except cv2.error:
-            pass
+        return canvas
 
     def show(self, cells_data: List[CellData], camera_frame: Optional[np.ndarray] = None) -> None:
         canvas: np.ndarray = self.render(cells_data, camera_frame)
@@ -249,10 +528,19 @@ class DataVisualizer:
         except cv2.error:
             self.should_close = True
 
+    def to_bytes(self, canvas: np.ndarray, fmt: str = ".ppm") -> bytes:
+        success: bool
+        encoded: np.ndarray
+        success, encoded = cv2.imencode(fmt, canvas)
+        if not success:
+            raise ValueError(f"Could not encode canvas as {fmt}")
+        return encoded.tobytes()
+
     def _mouse_callback(self, event: int, x: int, y: int, flags: int, param: Optional[Any]) -> None:
         if event == cv2.EVENT_MOUSEMOVE:
-            self.mouse_x: int = x
-            self.mouse_y: int = y
+            self.mouse_x = x
+            self.mouse_y = y
+            self._update_hovered()
         elif event == cv2.EVENT_LBUTTONDOWN:
             if self._is_point_in_bounds(x, y, self.close_button_bounds):
                 self.should_close = True
@@ -271,10 +559,17 @@ class DataVisualizer:
         x1, y1, x2, y2 = bounds
         return x1 <= x <= x2 and y1 <= y <= y2
 
-    def _is_mouse_over_bounds(self, bounds: Tuple[int, int, int, int]) -> bool:
-        if not hasattr(self, 'mouse_x') or not hasattr(self, 'mouse_y'):
-            return False
-        return self._is_point_in_bounds(self.mouse_x, self.mouse_y, bounds)
+    def _update_hovered(self) -> None:
+        if not self.button_bar_y <= self.mouse_y <= self.button_bar_y + self.button_height:
+            self._hovered = None
+        elif self._is_point_in_bounds(self.mouse_x, self.mouse_y, self.close_button_bounds):
+            self._hovered = "close"
+        elif self._is_point_in_bounds(self.mouse_x, self.mouse_y, self.toggle_camera_button_bounds):
+            self._hovered = "camera"
+        elif self._is_point_in_bounds(self.mouse_x, self.mouse_y, self.toggle_grid_button_bounds):
+            self._hovered = "grid"
+        else:
+            self._hovered = None
 
     def check_should_close(self) -> bool:
         return self.should_close